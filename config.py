@@ -14,7 +14,10 @@ class Config:
     replicate_api_key: str = os.getenv("REPLICATE_API_KEY")
     wiki_cdn_url: str = "https://raw.githubusercontent.com/MikeKovetsky/gamesmith/refs/heads/main/wiki"
     wiki_path: str = os.path.join(current_dir, "wiki")
+    batch_path: str = os.path.join(current_dir, "batches")
+    cache_path: str = os.path.join(current_dir, "cache")
     unreal_engine_version: str = "5.5"
+    engine_sample_rate: int = 48000
 
 
 config = Config()
\ No newline at end of file
@@ -0,0 +1,96 @@
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+
+ALPHA_THRESHOLD = 16
+BACKGROUND_TOLERANCE = 24
+MIN_COVERAGE = 0.02
+
+
+def slice_sprite_sheet(
+    sheet: Image.Image, rows: int, cols: int, icon_size: int = 256, padding: int = 16
+) -> list[Optional[Image.Image]]:
+    """Cut a grid sprite sheet into square, trimmed and padded icons.
+
+    All cells are processed at once as a single ``(rows * cols, h, w, 4)``
+    array: the foreground mask, bounding boxes and validation are computed
+    without a per-pixel Python loop.
+
+    Returns
+    -------
+    list[Optional[Image.Image]]
+        One entry per cell in row-major order. Cells that fail validation
+        (empty, too small, or touching the cell border, which means the item
+        bled into a neighbour) are ``None`` so the caller can regenerate them.
+    """
+    pixels = np.array(sheet.convert("RGBA"))
+    cell_h, cell_w = pixels.shape[0] // rows, pixels.shape[1] // cols
+    cells = (
+        pixels[: cell_h * rows, : cell_w * cols]
+        .reshape(rows, cell_h, cols, cell_w, 4)
+        .swapaxes(1, 2)
+        .reshape(rows * cols, cell_h, cell_w, 4)
+    )
+
+    mask = _foreground_mask(cells)
+    cells[..., 3] = np.where(mask, cells[..., 3], 0)
+
+    row_hits = mask.any(axis=2)
+    col_hits = mask.any(axis=1)
+    top = row_hits.argmax(axis=1)
+    bottom = cell_h - row_hits[:, ::-1].argmax(axis=1)
+    left = col_hits.argmax(axis=1)
+    right = cell_w - col_hits[:, ::-1].argmax(axis=1)
+
+    coverage = mask.mean(axis=(1, 2))
+    valid = (
+        (coverage >= MIN_COVERAGE)
+        & (top > 0)
+        & (left > 0)
+        & (bottom < cell_h)
+        & (right < cell_w)
+    )
+
+    icons: list[Optional[Image.Image]] = []
+    for index in range(rows * cols):
+        if not valid[index]:
+            icons.append(None)
+            continue
+        trimmed = cells[index, top[index] : bottom[index], left[index] : right[index]]
+        icons.append(_pad_icon(trimmed, icon_size, padding))
+    return icons
+
+
+def _foreground_mask(cells: np.ndarray) -> np.ndarray:
+    """Return a boolean ``(n, h, w)`` mask of the item pixels in every cell.
+
+    Sheets with real transparency are masked on alpha. Fully opaque sheets
+    (the model ignored the transparent-background request) are keyed against
+    the median colour of each cell's four corners.
+    """
+    alpha = cells[..., 3]
+    if (alpha < 255).any():
+        return alpha > ALPHA_THRESHOLD
+
+    rgb = cells[..., :3].astype(np.int16)
+    corners = rgb[:, [0, 0, -1, -1], [0, -1, 0, -1]]
+    background = np.median(corners, axis=1)
+    distance = np.abs(rgb - background[:, None, None, :]).max(axis=-1)
+    return distance > BACKGROUND_TOLERANCE
+
+
+def _pad_icon(trimmed: np.ndarray, icon_size: int, padding: int) -> Image.Image:
+    """Fit *trimmed* into a transparent ``icon_size`` square with *padding* on every side."""
+    content = Image.fromarray(np.ascontiguousarray(trimmed))
+    inner = icon_size - 2 * padding
+    scale = inner / max(content.width, content.height)
+    content = content.resize(
+        (max(1, round(content.width * scale)), max(1, round(content.height * scale))),
+        Image.Resampling.LANCZOS,
+    )
+
+    icon = Image.new("RGBA", (icon_size, icon_size), (0, 0, 0, 0))
+    icon.paste(content, ((icon_size - content.width) // 2, (icon_size - content.height) // 2))
+    return icon
@@ -1,2 +1,297 @@
-def create_sound(sound_description: str) -> str:
-     pass
\ No newline at end of file
+import re
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Optional, Protocol
+
+import numpy as np
+
+from config import config
+from smith.clients.replicate import Replicate
+from smith.models.asset import Asset
+from smith.models.wiki import WikiType
+from smith.utils.download import stream_to_file
+from smith.utils.paths import get_audio_path
+
+
+wiki_type = WikiType.LOCATION
+
+CHUNK_FRAMES = 1 << 18
+TARGET_RMS_DBFS = -20.0
+PEAK_CEILING_DBFS = -1.0
+CROSSFADE_SECONDS = 2.0
+ZERO_CROSSING_SEARCH_SECONDS = 0.05
+DEFAULT_DURATION_SECONDS = 10.0
+
+_DURATION = r"(\d+(?:\.\d+)?)\s*-?\s*(s|secs?|seconds?|mins?|minutes?)\b"
+_KIND = r"(?:seamless(?:ly)?[\s-]+)?(?:loop(?:s|ing|able)?|one[\s-]?shot)\b"
+# Most specific first: "Duration: 30 s", "60-second loop", "loop of 2 minutes",
+# then any duration that is not a repeat interval ("every 3 seconds").
+_DURATION_PATTERNS = [
+    re.compile(rf"\b(?:duration|length)\s*(?:[:=]|of)?\s*{_DURATION}", re.IGNORECASE),
+    re.compile(rf"{_DURATION}[\s-]*{_KIND}", re.IGNORECASE),
+    re.compile(rf"\b(?:loop|one[\s-]?shot)\s+(?:of|lasting|for)\s+{_DURATION}", re.IGNORECASE),
+    re.compile(rf"(?<!every )(?<!each )\b{_DURATION}", re.IGNORECASE),
+]
+_LOOP_PATTERN = re.compile(r"\bloop(?:s|ed|ing|able)?\b", re.IGNORECASE)
+_NEGATION_PATTERN = re.compile(r"(?:\b(?:not|no|non|never|without)|n't)[\s-]+(?:\w+\s+)?$", re.IGNORECASE)
+_ONE_SHOT_PATTERN = re.compile(r"\bone[\s-]?shot\b", re.IGNORECASE)
+
+# (format tag, bits per sample) -> sample dtype
+_WAV_DTYPES = {
+    (1, 8): np.dtype("u1"),
+    (1, 16): np.dtype("<i2"),
+    (1, 32): np.dtype("<i4"),
+    (3, 32): np.dtype("<f4"),
+    (3, 64): np.dtype("<f8"),
+}
+
+
+class SoundProvider(Protocol):
+    def generate(self, prompt: str, duration: float, dest_path: Path) -> None:
+        """Write a WAV clip of roughly *duration* seconds for *prompt* to *dest_path*."""
+
+
+class ReplicateSoundProvider:
+    model = "sepal/audiogen:154b3e5141493cb1b8cec976d9aa90f2b691137e39ad906d2421b74c2a8c52b8"
+
+    def generate(self, prompt: str, duration: float, dest_path: Path) -> None:
+        output = Replicate.run_replicate(
+            self.model,
+            input={
+                "prompt": prompt,
+                "duration": duration,
+                "output_format": "wav",
+            },
+        )
+        audio_url = output.url if hasattr(output, "url") else output
+        stream_to_file(audio_url, dest_path)
+
+
+def create_sound(
+    node_name: str, asset: Asset, provider: Optional[SoundProvider] = None, overwrite: bool = False
+) -> Path:
+    """Generate an audio asset and store it as an engine-ready WAV.
+
+    The duration and loop flag are read from the asset prompt (the map prompt
+    asks for e.g. "60-second loop, seamlessly loopable"). The raw clip from
+    *provider* is resampled to ``config.engine_sample_rate``, loudness
+    normalised and, for loops, crossfade-stitched into a seamless loop.
+
+    An existing clip is kept unless *overwrite* is set, and is only replaced
+    once the new clip has been fully processed.
+    """
+    print(f"Creating sound {asset.name} for {node_name}")
+
+    output_dir = get_audio_path(wiki_type, node_name)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    dest_path = output_dir / f"{asset.name}.wav"
+
+    if not overwrite and dest_path.exists():
+        print(f"Sound {asset.name} already exists in {node_name}")
+        return dest_path
+
+    duration, loop = parse_audio_spec(asset.prompt)
+    provider = provider or ReplicateSoundProvider()
+
+    # Scratch files live on disk next to the cache, not in a RAM-backed /tmp.
+    Path(config.cache_path).mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=config.cache_path) as work_dir:
+        raw_path = Path(work_dir) / "raw.wav"
+        # A loop loses one crossfade worth of audio when stitched.
+        provider.generate(asset.prompt, duration + (CROSSFADE_SECONDS if loop else 0.0), raw_path)
+        processed_path = Path(work_dir) / "processed.wav"
+        process_clip(raw_path, processed_path, Path(work_dir), loop=loop)
+        shutil.move(processed_path, dest_path)
+
+    print(f"Saved sound to {dest_path}")
+    return dest_path
+
+
+def parse_audio_spec(prompt: str) -> tuple[float, bool]:
+    """Return ``(duration_seconds, loop)`` described in an audio asset prompt.
+
+    A duration next to "loop", "one-shot" or "Duration:" wins over other
+    numbers in the prompt, and negated mentions ("should not loop",
+    "non-looping") do not count as a loop.
+    """
+    duration = DEFAULT_DURATION_SECONDS
+    for pattern in _DURATION_PATTERNS:
+        match = pattern.search(prompt)
+        if match:
+            duration = float(match.group(1))
+            if match.group(2).lower().startswith("m"):
+                duration *= 60
+            break
+
+    loop = not _ONE_SHOT_PATTERN.search(prompt) and any(
+        not _NEGATION_PATTERN.search(prompt[: mention.start()])
+        for mention in _LOOP_PATTERN.finditer(prompt)
+    )
+    return duration, loop
+
+
+def process_clip(
+    src_path: Path,
+    dest_path: Path,
+    work_dir: Path,
+    sample_rate: Optional[int] = None,
+    loop: bool = False,
+) -> None:
+    """Resample, normalise and optionally loop-stitch *src_path* into a 16-bit WAV.
+
+    Every step streams ``CHUNK_FRAMES`` at a time through memory-mapped
+    buffers, so clips far larger than RAM can be processed.
+    """
+    sample_rate = sample_rate or config.engine_sample_rate
+    source, source_rate = read_wav(src_path)
+    channels = source.shape[1]
+
+    frame_count = round(len(source) * sample_rate / source_rate)
+    resampled = np.lib.format.open_memmap(
+        work_dir / "resampled.npy", mode="w+", dtype=np.float32, shape=(frame_count, channels)
+    )
+    _resample_into(source, source_rate, resampled, sample_rate)
+    gain = _loudness_gain(resampled)
+
+    start, end, crossfade = 0, frame_count, 0
+    if loop:
+        crossfade = min(int(CROSSFADE_SECONDS * sample_rate), frame_count // 4)
+        search = int(ZERO_CROSSING_SEARCH_SECONDS * sample_rate)
+        start = _rising_zero_crossing(resampled, 0, min(search, frame_count), default=0)
+        tail_start = _rising_zero_crossing(
+            resampled,
+            max(start + crossfade, frame_count - crossfade - search),
+            frame_count - crossfade,
+            default=frame_count - crossfade,
+            last=True,
+        )
+        end = tail_start + crossfade
+
+    output_frames = end - start - crossfade
+    output = _create_wav(dest_path, output_frames, channels, sample_rate)
+    for i in range(0, output_frames, CHUNK_FRAMES):
+        j = min(i + CHUNK_FRAMES, output_frames)
+        block = np.array(resampled[start + i : start + j])
+        if i < crossfade:
+            # Equal-power fade from the tail into the head, so the last output
+            # frame flows straight into the first one when the clip wraps.
+            k = min(j, crossfade)
+            t = ((np.arange(i, k) + 0.5) / crossfade)[:, None]
+            tail = resampled[end - crossfade + i : end - crossfade + k]
+            block[: k - i] = block[: k - i] * np.sqrt(t) + tail * np.sqrt(1.0 - t)
+        output[i:j] = np.clip(block * gain * 32768.0, -32768, 32767).astype(np.int16)
+    output.flush()
+    del output, resampled
+
+
+def read_wav(path: Path) -> tuple[np.memmap, int]:
+    """Memory-map the sample data of a PCM or float WAV as ``(frames, channels)``.
+
+    Returns
+    -------
+    tuple[np.memmap, int]
+        The samples and the sample rate.
+    """
+    with open(path, "rb") as fp:
+        riff, _, wave = struct.unpack("<4sI4s", fp.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError(f"{path} is not a WAV file.")
+
+        fmt: Optional[tuple[int, int, int, int]] = None
+        while True:
+            header = fp.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path} has no data chunk.")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                body = fp.read(size + size % 2)
+                format_tag, channels, rate, _, _, bits = struct.unpack("<HHIIHH", body[:16])
+                if format_tag == 0xFFFE:  # WAVE_FORMAT_EXTENSIBLE: the real tag opens the sub-format GUID
+                    format_tag = struct.unpack("<H", body[24:26])[0]
+                fmt = (format_tag, channels, rate, bits)
+            elif chunk_id == b"data":
+                data_offset = fp.tell()
+                break
+            else:
+                fp.seek(size + size % 2, 1)
+
+    if fmt is None:
+        raise ValueError(f"{path} has no fmt chunk before its data.")
+    format_tag, channels, rate, bits = fmt
+    dtype = _WAV_DTYPES.get((format_tag, bits))
+    if dtype is None:
+        raise ValueError(f"Unsupported WAV encoding in {path}: format {format_tag}, {bits} bits.")
+
+    # Streamed WAVs often leave the data size at 0 or 0xFFFFFFFF, so trust the file size instead.
+    available = path.stat().st_size - data_offset
+    if 0 < size < available:
+        available = size
+    frames = available // (dtype.itemsize * channels)
+    return np.memmap(path, dtype=dtype, mode="r", offset=data_offset, shape=(frames, channels)), rate
+
+
+def _create_wav(path: Path, frames: int, channels: int, sample_rate: int) -> np.memmap:
+    data_size = frames * channels * 2
+    with open(path, "wb") as fp:
+        fp.write(struct.pack("<4sI4s", b"RIFF", 36 + data_size, b"WAVE"))
+        fp.write(struct.pack("<4sIHHIIHH", b"fmt ", 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16))
+        fp.write(struct.pack("<4sI", b"data", data_size))
+    return np.memmap(path, dtype="<i2", mode="r+", offset=44, shape=(frames, channels))
+
+
+def _to_float(samples: np.ndarray) -> np.ndarray:
+    if samples.dtype == np.uint8:
+        return (samples.astype(np.float32) - 128.0) / 128.0
+    if samples.dtype.kind == "i":
+        return samples.astype(np.float32) / float(-np.iinfo(samples.dtype).min)
+    return samples.astype(np.float32)
+
+
+def _resample_into(source: np.ndarray, source_rate: int, output: np.ndarray, sample_rate: int) -> None:
+    """Linearly resample *source* into the preallocated *output*, one chunk at a time."""
+    if source_rate == sample_rate:
+        for i in range(0, len(output), CHUNK_FRAMES):
+            output[i : i + CHUNK_FRAMES] = _to_float(source[i : i + CHUNK_FRAMES])
+        return
+
+    step = source_rate / sample_rate
+    for i in range(0, len(output), CHUNK_FRAMES):
+        j = min(i + CHUNK_FRAMES, len(output))
+        positions = np.arange(i, j) * step
+        lo = int(positions[0])
+        hi = min(int(positions[-1]) + 2, len(source))
+        segment = _to_float(source[lo:hi])
+        offsets = np.arange(hi - lo)
+        for channel in range(output.shape[1]):
+            output[i:j, channel] = np.interp(positions - lo, offsets, segment[:, channel])
+
+
+def _loudness_gain(samples: np.ndarray) -> float:
+    """Gain that brings *samples* to ``TARGET_RMS_DBFS`` without pushing peaks past ``PEAK_CEILING_DBFS``."""
+    square_sum = 0.0
+    peak = 0.0
+    for i in range(0, len(samples), CHUNK_FRAMES):
+        block = np.asarray(samples[i : i + CHUNK_FRAMES], dtype=np.float64)
+        square_sum += float(np.square(block).sum())
+        peak = max(peak, float(np.abs(block).max(initial=0.0)))
+
+    if peak == 0.0:
+        return 1.0
+    rms = np.sqrt(square_sum / samples.size)
+    gain = 10 ** (TARGET_RMS_DBFS / 20) / rms
+    return float(min(gain, 10 ** (PEAK_CEILING_DBFS / 20) / peak))
+
+
+def _rising_zero_crossing(
+    samples: np.ndarray, lo: int, hi: int, default: int, last: bool = False
+) -> int:
+    """Index of the first (or *last*) rising zero crossing of the mono mix in ``[lo, hi)``."""
+    if hi - lo < 2:
+        return default
+    mono = np.asarray(samples[lo:hi]).mean(axis=1)
+    crossings = np.flatnonzero((mono[:-1] < 0) & (mono[1:] >= 0)) + 1
+    if not len(crossings):
+        return default
+    return lo + int(crossings[-1] if last else crossings[0])
@@ -1,5 +1,29 @@
+import hashlib
+import json
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
 from pydantic import BaseModel
+
+from config import config
 from smith.clients.replicate import Replicate
+from smith.models.wiki import WikiType
+from smith.utils.download import stream_to_file
+from smith.utils.paths import get_node_map_path, get_node_path, get_voice_path
+
+
+wiki_type = WikiType.CHARACTER
+
+MAX_CONCURRENT_VOICES = 4
+MIN_SECONDS_BETWEEN_REQUESTS = 1.0
+DEFAULT_EMOTION = "auto"
+# build_prompt and create_character still write voice_id "1" as a placeholder.
+PLACEHOLDER_VOICE_ID = "1"
+DEFAULT_VOICE_ID = "Deep_Voice_Man"
 
 
 class VoiceConfig(BaseModel):
@@ -7,6 +31,10 @@ class VoiceConfig(BaseModel):
      emotion: str
      voice_id: str
 
+     def cache_key(self) -> str:
+          payload = json.dumps([self.text, self.emotion, self.voice_id])
+          return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
 
 def create_voice(voice_config: VoiceConfig) -> str:
      output = Replicate.run_replicate(
@@ -25,4 +53,150 @@ def create_voice(voice_config: VoiceConfig) -> str:
                "english_normalization": True
           }
           )
-     return output
\ No newline at end of file
+     return output
+
+
+def create_voices(node_name: str) -> dict[str, list[dict]]:
+     """Voice every replica of a character, or of all characters below a faction.
+
+     *node_name* may point at a single character (``caladyn/ashwalkers/dustmother``)
+     or at a folder of characters (``caladyn/ashwalkers``). Identical
+     (text, emotion, voice_id) lines are synthesized once and kept in a
+     persistent phrase cache under ``config.cache_path``, so re-voicing only
+     calls the model for lines it has never heard before.
+
+     Each character gets ``assets/voice/<clip>.mp3`` files and an
+     ``assets/voice/index.json`` that maps every line to its clip.
+
+     Returns
+     -------
+     dict[str, list[dict]]
+          The written index for every character, keyed by character name.
+     """
+     character_lines = {
+          character_name: _get_voice_configs(character_name)
+          for character_name in _find_characters(node_name)
+     }
+
+     unique_lines = {
+          line.cache_key(): line for lines in character_lines.values() for line in lines
+     }
+     missing = [line for key, line in unique_lines.items() if not _get_cached_clip(key).exists()]
+     print(
+          f"Voicing {len(character_lines)} characters: {len(unique_lines)} unique lines, "
+          f"{len(missing)} to synthesize"
+     )
+     _synthesize(missing)
+
+     return {
+          character_name: _write_character_clips(character_name, lines)
+          for character_name, lines in character_lines.items()
+     }
+
+
+def _find_characters(node_name: str) -> list[str]:
+     characters_root = get_node_path(wiki_type, "")
+     return sorted(
+          map_path.parent.relative_to(characters_root).as_posix()
+          for map_path in get_node_path(wiki_type, node_name).rglob("map.json")
+     )
+
+
+def _get_voice_configs(character_name: str) -> list[VoiceConfig]:
+     metadata = json.loads(get_node_map_path(wiki_type, character_name).read_text())
+     voice_id = str(metadata.get("voice_id", PLACEHOLDER_VOICE_ID))
+     if voice_id == PLACEHOLDER_VOICE_ID:
+          print(f"⚠️  {character_name} has no real voice_id – using {DEFAULT_VOICE_ID}.")
+          voice_id = DEFAULT_VOICE_ID
+
+     lines: list[VoiceConfig] = []
+     for replica in metadata.get("replicas", []):
+          if isinstance(replica, str):
+               replica = {"text": replica}
+          lines.append(
+               VoiceConfig(
+                    text=replica["text"],
+                    emotion=replica.get("emotion", DEFAULT_EMOTION),
+                    voice_id=_resolve_voice_id(replica.get("voice_id"), voice_id),
+               )
+          )
+     return lines
+
+
+def _resolve_voice_id(voice_id: Optional[str], default: str) -> str:
+     if voice_id is None or str(voice_id) == PLACEHOLDER_VOICE_ID:
+          return default
+     return str(voice_id)
+
+
+def _synthesize(lines: list[VoiceConfig]) -> None:
+     if not lines:
+          return
+
+     rate_limiter = _RateLimiter(MIN_SECONDS_BETWEEN_REQUESTS)
+
+     def synthesize_line(line: VoiceConfig) -> None:
+          rate_limiter.wait()
+          output = create_voice(line)
+          audio_url = output.url if hasattr(output, "url") else output
+          stream_to_file(audio_url, _get_cached_clip(line.cache_key()))
+
+     with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_VOICES) as executor:
+          future_to_line = {executor.submit(synthesize_line, line): line for line in lines}
+          for future in as_completed(future_to_line):
+               line = future_to_line[future]
+               try:
+                    future.result()
+               except Exception as exc:
+                    print(f"❌ Error voicing {line.text!r}: {exc}")
+
+
+def _write_character_clips(character_name: str, lines: list[VoiceConfig]) -> list[dict]:
+     voice_dir = get_voice_path(wiki_type, character_name)
+     voice_dir.mkdir(parents=True, exist_ok=True)
+
+     index: list[dict] = []
+     for line in lines:
+          key = line.cache_key()
+          cached_clip = _get_cached_clip(key)
+          if not cached_clip.exists():
+               continue
+          clip_path = voice_dir / cached_clip.name
+          if not clip_path.exists():
+               shutil.copyfile(cached_clip, clip_path)
+          index.append({**line.model_dump(), "clip": clip_path.name})
+
+     # Clips of removed or edited lines are still in the phrase cache if needed again.
+     referenced = {entry["clip"] for entry in index}
+     for clip_path in voice_dir.glob("*.mp3"):
+          if clip_path.name not in referenced:
+               clip_path.unlink()
+
+     index_path = voice_dir / "index.json"
+     index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+     print(f"Voice index for {character_name} saved to {index_path}")
+     return index
+
+
+def _get_cached_clip(cache_key: str) -> Path:
+     return Path(config.cache_path) / "voice" / f"{cache_key}.mp3"
+
+
+class _RateLimiter:
+     """Space out request starts across threads by at least *interval* seconds."""
+
+     def __init__(self, interval: float):
+          self._interval = interval
+          self._lock = threading.Lock()
+          self._next_start = 0.0
+
+     def wait(self) -> None:
+          with self._lock:
+               now = time.monotonic()
+               start = max(now, self._next_start)
+               self._next_start = start + self._interval
+          time.sleep(start - now)
+
+
+if __name__ == "__main__":
+     create_voices("caladyn/ashwalkers")
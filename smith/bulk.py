@@ -0,0 +1,103 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from config import config
+from smith.character.character import build_metadata_request, save_metadata
+from smith.clients.openai import OpenAI
+from smith.location.map import build_map_request, save_location_map
+from smith.models.wiki import WikiType
+
+
+def create_bulk(
+    location_names: Optional[list[str]] = None,
+    character_names: Optional[list[str]] = None,
+    custom_prompt: str = "",
+    poll_interval: float = 60.0,
+) -> list[str]:
+    """Regenerate location maps and character metadata through the OpenAI Batch API.
+
+    Trades latency (up to the 24 h completion window) for the discounted
+    batch price and separate rate limits. Set ``OPENAI_BASE_URL`` to run
+    against a local stand-in batch endpoint such as
+    ``smith.clients.local_batch.serve_local_batches``.
+
+    Returns
+    -------
+    list[str]
+        The ``custom_id`` of every node whose result was applied.
+    """
+    requests_path = write_bulk_requests(location_names or [], character_names or [], custom_prompt)
+    batch_id = OpenAI.submit_batch(requests_path)
+    print(f"Submitted batch {batch_id} from {requests_path}")
+    return apply_bulk_results(batch_id, poll_interval)
+
+
+def write_bulk_requests(location_names: list[str], character_names: list[str], custom_prompt: str = "") -> Path:
+    """Write one chat-completion request per node to a JSONL file under ``config.batch_path``."""
+    builders = [(WikiType.LOCATION, name, build_map_request) for name in location_names] + [
+        (WikiType.CHARACTER, name, build_metadata_request) for name in character_names
+    ]
+    if not builders:
+        raise ValueError("No nodes given for the bulk request.")
+
+    batch_dir = Path(config.batch_path)
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    requests_path = batch_dir / f"{datetime.now():%Y%m%d-%H%M%S}.jsonl"
+
+    with open(requests_path, "w", encoding="utf-8") as f:
+        for node_type, node_name, build_request in builders:
+            request = {
+                "custom_id": _to_custom_id(node_type, node_name),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": OpenAI.build_chat_body(*build_request(node_name, custom_prompt)),
+            }
+            f.write(json.dumps(request) + "\n")
+
+    print(f"Wrote {len(builders)} batch requests to {requests_path}")
+    return requests_path
+
+
+def apply_bulk_results(batch_id: str, poll_interval: float = 60.0) -> list[str]:
+    """Wait for *batch_id* and write every result back into its node's ``map.json``.
+
+    Safe to call again for a batch that was submitted by an earlier run.
+    """
+    results = OpenAI.get_batch_results(batch_id, poll_interval)
+
+    applied: list[str] = []
+    for custom_id, response in results.items():
+        node_type, node_name = _from_custom_id(custom_id)
+        try:
+            match node_type:
+                case WikiType.LOCATION:
+                    save_location_map(node_name, response)
+                case WikiType.CHARACTER:
+                    save_metadata(node_name, response)
+                case _:
+                    raise ValueError(f"Unsupported WikiType in batch: {node_type}")
+        except Exception as exc:
+            print(f"❌ Error applying {custom_id}: {exc}")
+            continue
+        applied.append(custom_id)
+
+    print(f"Applied {len(applied)}/{len(results)} batch results from {batch_id}")
+    return applied
+
+
+def _to_custom_id(node_type: WikiType, node_name: str) -> str:
+    return f"{node_type.value}:{node_name}"
+
+
+def _from_custom_id(custom_id: str) -> tuple[WikiType, str]:
+    node_type, node_name = custom_id.split(":", 1)
+    return WikiType(node_type), node_name
+
+
+if __name__ == "__main__":
+    create_bulk(
+        location_names=["caladyn/aroth-kai", "caladyn/cala/market"],
+        character_names=["caladyn/mobs/crab", "caladyn/mobs/paleheart"],
+    )
@@ -35,19 +35,7 @@ def create_character(character_name: str, custom_prompt: str = "") -> dict:
     
     print(f"Creating character: {character_name}")
 
-    metadata_path = get_node_map_path(wiki_type, character_name)
-    existing_metadata: Optional[dict] = None
-    if metadata_path.exists():
-        try:
-            existing_metadata = json.loads(metadata_path.read_text())
-        except json.JSONDecodeError:
-            print(f"⚠️  Existing map.json for '{character_name}' is not valid JSON – it will be ignored and regenerated.")
-
-    user_prompt = build_prompt(character_name, existing_metadata, custom_prompt)
-
-    system_prompt = (
-        "You are a creative game-writing assistant specialised in writing a config/metadata for NPCs and creatures."
-    )
+    system_prompt, user_prompt, _ = build_metadata_request(character_name, custom_prompt)
 
     response = {
         "replicas": [],
@@ -59,8 +47,7 @@ def create_character(character_name: str, custom_prompt: str = "") -> dict:
     # ------------------------------------------------------------------
     # 3. Persist metadata to disk
     # ------------------------------------------------------------------
-    metadata_path.write_text(json.dumps(response, indent=2), encoding="utf-8")
-    print(f"Metadata saved to {metadata_path.relative_to(Path.cwd())}")
+    save_metadata(character_name, response)
 
     # ------------------------------------------------------------------
     # 4. Build 3-D model with Trellis – use prepared arts when present
@@ -71,6 +58,49 @@ def create_character(character_name: str, custom_prompt: str = "") -> dict:
     return response
 
 
+def build_metadata_request(character_name: str, custom_prompt: str = "") -> tuple[str, str, list[str]]:
+    """Return the ``(system_prompt, user_prompt, image_urls)`` used to generate character metadata."""
+    metadata_path = get_node_map_path(wiki_type, character_name)
+    existing_metadata: Optional[dict] = None
+    if metadata_path.exists():
+        try:
+            existing_metadata = json.loads(metadata_path.read_text())
+        except json.JSONDecodeError:
+            print(f"⚠️  Existing map.json for '{character_name}' is not valid JSON – it will be ignored and regenerated.")
+
+    user_prompt = build_prompt(character_name, existing_metadata, custom_prompt)
+
+    system_prompt = (
+        "You are a creative game-writing assistant specialised in writing a config/metadata for NPCs and creatures."
+    )
+
+    art_urls = [
+        get_art_url(wiki_type, character_name, name) for name in get_node_arts(wiki_type, character_name)
+    ]
+    return system_prompt, user_prompt, art_urls
+
+
+def save_metadata(character_name: str, metadata: dict) -> None:
+    """Merge *metadata* into the character's map.json.
+
+    Keys in *metadata* replace existing ones. ``build_prompt`` already sends
+    the existing replicas, so a returned ``replicas`` list is saved as is;
+    hand-authored replicas are only kept when the response has no such key.
+    """
+    metadata_path = get_node_map_path(wiki_type, character_name)
+    existing_metadata: dict = {}
+    if metadata_path.exists():
+        try:
+            existing_metadata = json.loads(metadata_path.read_text())
+        except json.JSONDecodeError:
+            pass
+
+    metadata = {**existing_metadata, **metadata}
+
+    metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    print(f"Metadata saved to {metadata_path.relative_to(Path.cwd())}")
+
+
 if __name__ == "__main__":
     mobs = [
         "dustmother",
@@ -0,0 +1,146 @@
+import json
+import sys
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import default
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def serve_local_batches(responses: dict[str, dict], port: int = 0) -> ThreadingHTTPServer:
+    """Start a stand-in for the OpenAI Files and Batch endpoints in a background thread.
+
+    Every batch completes as soon as it is created. A request whose
+    ``custom_id`` is in *responses* is answered with that JSON content;
+    any other request is written to the batch error file. Point the client
+    at it with ``OPENAI_BASE_URL=http://127.0.0.1:<port>/v1``.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), _LocalBatchHandler)
+    server.responses = responses
+    server.files = {}
+    server.batches = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Local batch endpoint listening on http://127.0.0.1:{server.server_port}/v1")
+    return server
+
+
+class _LocalBatchHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        match self.path:
+            case "/v1/files":
+                self._send_json(self._create_file(body))
+            case "/v1/batches":
+                self._send_json(self._create_batch(json.loads(body)))
+            case _:
+                self.send_error(404)
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts[:2] == ["v1", "batches"] and len(parts) == 3 and parts[2] in self.server.batches:
+            self._send_json(self.server.batches[parts[2]])
+        elif parts[:2] == ["v1", "files"] and len(parts) == 4 and parts[2] in self.server.files:
+            content = self.server.files[parts[2]]
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+        else:
+            self.send_error(404)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _create_file(self, body: bytes) -> dict:
+        message = BytesParser(policy=default).parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + body
+        )
+        content = b""
+        for part in message.iter_parts():
+            if part.get_param("name", header="content-disposition") == "file":
+                content = part.get_payload(decode=True)
+        return self._store_file(content, "batch")
+
+    def _store_file(self, content: bytes, purpose: str) -> dict:
+        file_id = f"file-{uuid.uuid4().hex}"
+        self.server.files[file_id] = content
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": f"{file_id}.jsonl",
+            "purpose": purpose,
+            "status": "processed",
+        }
+
+    def _create_batch(self, request: dict) -> dict:
+        output_rows: list[dict] = []
+        error_rows: list[dict] = []
+        for line in self.server.files[request["input_file_id"]].decode().splitlines():
+            if not line.strip():
+                continue
+            custom_id = json.loads(line)["custom_id"]
+            row_id = f"batch_req_{uuid.uuid4().hex}"
+            if custom_id not in self.server.responses:
+                error_rows.append({
+                    "id": row_id,
+                    "custom_id": custom_id,
+                    "response": None,
+                    "error": {"code": "not_found", "message": f"No stand-in response for {custom_id}"},
+                })
+                continue
+            output_rows.append({
+                "id": row_id,
+                "custom_id": custom_id,
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": json.dumps(self.server.responses[custom_id])}}]},
+                },
+                "error": None,
+            })
+
+        now = int(time.time())
+        batch = {
+            "id": f"batch_{uuid.uuid4().hex}",
+            "object": "batch",
+            "endpoint": request["endpoint"],
+            "input_file_id": request["input_file_id"],
+            "completion_window": request["completion_window"],
+            "status": "completed",
+            "created_at": now,
+            "completed_at": now,
+            "output_file_id": self._rows_to_file(output_rows),
+            "error_file_id": self._rows_to_file(error_rows),
+            "request_counts": {
+                "total": len(output_rows) + len(error_rows),
+                "completed": len(output_rows),
+                "failed": len(error_rows),
+            },
+        }
+        self.server.batches[batch["id"]] = batch
+        return batch
+
+    def _rows_to_file(self, rows: list[dict]):
+        if not rows:
+            return None
+        content = "".join(json.dumps(row) + "\n" for row in rows).encode()
+        return self._store_file(content, "batch_output")["id"]
+
+    def _send_json(self, payload: dict) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+if __name__ == "__main__":
+    # python -m smith.clients.local_batch responses.json [port]
+    with open(sys.argv[1], encoding="utf-8") as f:
+        serve_local_batches(json.load(f), int(sys.argv[2]) if len(sys.argv) > 2 else 8765)
+    threading.Event().wait()
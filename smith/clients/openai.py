@@ -1,8 +1,14 @@
 import json
+import time
+from pathlib import Path
+
 import openai
 from pydantic import BaseModel
 
 
+_BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
 class OpenAI(BaseModel):
      
     @staticmethod
@@ -10,6 +16,18 @@ class OpenAI(BaseModel):
         system_prompt: str, user_prompt: str, image_urls: list[str]
     ) -> dict:
         client = openai.OpenAI()
+        response = client.chat.completions.create(
+            **OpenAI.build_chat_body(system_prompt, user_prompt, image_urls)
+        )
+        content = response.choices[0].message.content
+        if content is None:
+            raise ValueError(f"No content returned from OpenAI. Message: {response.choices[0].message}")
+        data_dict = json.loads(content)
+        return data_dict
+
+    @staticmethod
+    def build_chat_body(system_prompt: str, user_prompt: str, image_urls: list[str]) -> dict:
+        """Return the chat-completion request body shared by ``complete`` and batch requests."""
         image_messages = []
         for art_url in image_urls:
             image_messages.append({"type": "image_url", "image_url": {"url": art_url}})
@@ -20,20 +38,82 @@ class OpenAI(BaseModel):
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_content},
         ]
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            response_format={"type": "json_object"},
-            messages=messages,
-            temperature=0.7,
+        return {
+            "model": "gpt-4o",
+            "response_format": {"type": "json_object"},
+            "messages": messages,
+            "temperature": 0.7,
+        }
+
+    @staticmethod
+    def submit_batch(requests_path: Path) -> str:
+        """Upload a JSONL file of chat-completion requests and start a batch.
+
+        The client honours ``OPENAI_BASE_URL``, so batches can be pointed at a
+        local stand-in endpoint.
+
+        Returns
+        -------
+        str
+            The id of the created batch.
+        """
+        client = openai.OpenAI()
+        with open(requests_path, "rb") as fp:
+            batch_file = client.files.create(file=fp, purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
         )
-        content = response.choices[0].message.content
-        if content is None:
-            raise ValueError(f"No content returned from OpenAI. Message: {response.choices[0].message}")
-        data_dict = json.loads(content)
-        return data_dict
+        return batch.id
+
+    @staticmethod
+    def get_batch_results(batch_id: str, poll_interval: float = 60.0) -> dict[str, dict]:
+        """Poll *batch_id* until it finishes and return the parsed JSON answers.
+
+        Returns
+        -------
+        dict[str, dict]
+            The JSON content of every successful request, keyed by its
+            ``custom_id``. Failed requests, whether in the output file or the
+            batch error file, are reported and left out.
+        """
+        client = openai.OpenAI()
+        batch = client.batches.retrieve(batch_id)
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            print(f"Batch {batch_id} is {batch.status}; checking again in {poll_interval:.0f}s")
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch_id)
+
+        if batch.output_file_id is None and batch.error_file_id is None:
+            raise RuntimeError(
+                f"Batch {batch_id} finished as {batch.status!r} without any output. Errors: {batch.errors}"
+            )
+
+        results: dict[str, dict] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id is None:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                custom_id = row["custom_id"]
+                response = row.get("response") or {}
+                if row.get("error") or response.get("status_code") != 200:
+                    print(f"⚠️  Batch request {custom_id} failed: {row.get('error') or response.get('body')}")
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                try:
+                    results[custom_id] = json.loads(content)
+                except (TypeError, json.JSONDecodeError):
+                    print(f"⚠️  Batch request {custom_id} returned invalid JSON: {content!r}")
+        return results
 
     @staticmethod
-    def create_image(prompt: str, size: str = "1024x1024", model: str = "gpt-image-1") -> str:
+    def create_image(
+        prompt: str, size: str = "1024x1024", model: str = "gpt-image-1", background: str = "auto"
+    ) -> str:
         """Generate an image from a text prompt using the newest GPT image model.
 
         Parameters
@@ -45,18 +125,27 @@ class OpenAI(BaseModel):
         model : str, optional
             Which image-generation model to use. Defaults to ``gpt-image-1`` as per
             https://platform.openai.com/docs/guides/image-generation?image-generation-model=gpt-image-1
+        background : str, optional
+            ``"transparent"``, ``"opaque"`` or ``"auto"`` (default). Only
+            supported by the GPT image models.
 
         Returns
         -------
         str
-            A direct URL to the generated image.
+            The generated image as a base64-encoded string.
         """
         client = openai.OpenAI()
+        if model.startswith("dall-e"):
+            # DALL·E returns URLs unless asked otherwise and has no background option.
+            options = {"response_format": "b64_json"}
+        else:
+            # GPT image models always return base64 and reject ``response_format``.
+            options = {"background": background}
         response = client.images.generate(
             model=model,
             prompt=prompt,
             n=1,
             size=size,
-            response_format="b64_json",
+            **options,
         )
         return response.data[0].b64_json
@@ -0,0 +1,158 @@
+import base64
+import io
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+from config import config
+from smith.assetsmith.icon import slice_sprite_sheet
+from smith.clients.openai import OpenAI
+from smith.models.node import Node
+from smith.models.wiki import WikiType
+from smith.utils.paths import get_icon_path, get_node_map
+
+
+wiki_type = WikiType.ITEM
+
+SHEET_SIZE = "1024x1024"
+MAX_ITEMS_PER_SHEET = 16
+
+
+def create_item_icons(
+    item_names: list[str], custom_prompt: str = "", overwrite: bool = False
+) -> dict[str, Path]:
+    """Generate inventory icons for *item_names* using as few image calls as possible.
+
+    Items are packed up to ``MAX_ITEMS_PER_SHEET`` per sprite sheet. Each sheet
+    is generated by a single ``OpenAI.create_image`` call, sliced locally into
+    trimmed, padded icons and written to ``wiki/items/<name>/assets/icons``.
+    Cells that fail validation are regenerated with a single-item call.
+    Existing icons are kept unless *overwrite* is set.
+
+    Returns
+    -------
+    dict[str, Path]
+        The icon path of every item that was created in this run.
+    """
+    pending: list[tuple[str, Node]] = []
+    for item_name in item_names:
+        if not overwrite and _get_icon_file(item_name).exists():
+            print(f"Icon for {item_name} already exists")
+            continue
+        pending.append((item_name, get_node_map(wiki_type, item_name)))
+
+    batches = [
+        pending[i : i + MAX_ITEMS_PER_SHEET] for i in range(0, len(pending), MAX_ITEMS_PER_SHEET)
+    ]
+
+    icon_paths: dict[str, Path] = {}
+    if not batches:
+        return icon_paths
+
+    with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+        future_to_batch = {
+            executor.submit(_create_sheet_icons, batch, custom_prompt): batch for batch in batches
+        }
+        for future in as_completed(future_to_batch):
+            try:
+                icon_paths.update(future.result())
+            except Exception as exc:
+                batch = future_to_batch[future]
+                print(f"⚠️  Icon sheet failed ({exc}) – falling back to single-item calls for {len(batch)} items.")
+                icon_paths.update(_create_single_icons(batch, custom_prompt))
+
+    return icon_paths
+
+
+def _create_sheet_icons(items: list[tuple[str, Node]], custom_prompt: str) -> dict[str, Path]:
+    cols = math.ceil(math.sqrt(len(items)))
+    rows = math.ceil(len(items) / cols)
+
+    print(f"Creating a {rows}x{cols} icon sheet for {len(items)} items")
+    prompt = _build_sheet_prompt([node for _, node in items], rows, cols, custom_prompt)
+    sheet = _generate_image(prompt)
+    icons = slice_sprite_sheet(sheet, rows, cols)
+
+    icon_paths: dict[str, Path] = {}
+    failed: list[tuple[str, Node]] = []
+    for (item_name, node), icon in zip(items, icons):
+        if icon is None:
+            print(f"⚠️  Sheet cell for {item_name} failed validation – falling back to a single-item call.")
+            failed.append((item_name, node))
+            continue
+        icon_paths[item_name] = _save_icon(item_name, icon)
+
+    icon_paths.update(_create_single_icons(failed, custom_prompt))
+    return icon_paths
+
+
+def _create_single_icons(items: list[tuple[str, Node]], custom_prompt: str) -> dict[str, Path]:
+    icon_paths: dict[str, Path] = {}
+    for item_name, node in items:
+        try:
+            icon_paths[item_name] = _save_icon(item_name, _create_single_icon(item_name, node, custom_prompt))
+        except Exception as exc:
+            print(f"❌ Error creating icon for {item_name}: {exc}")
+    return icon_paths
+
+
+def _create_single_icon(item_name: str, node: Node, custom_prompt: str) -> Image.Image:
+    prompt = _build_sheet_prompt([node], 1, 1, custom_prompt)
+    icon = slice_sprite_sheet(_generate_image(prompt), 1, 1)[0]
+    if icon is None:
+        raise RuntimeError(f"Generated icon for '{item_name}' is empty or cropped.")
+    return icon
+
+
+def _generate_image(prompt: str) -> Image.Image:
+    b64_image = OpenAI.create_image(prompt=prompt, size=SHEET_SIZE, background="transparent")
+    return Image.open(io.BytesIO(base64.b64decode(b64_image)))
+
+
+def _save_icon(item_name: str, icon: Image.Image) -> Path:
+    icon_file = _get_icon_file(item_name)
+    icon_file.parent.mkdir(parents=True, exist_ok=True)
+    icon.save(icon_file)
+    print(f"Saved icon to {icon_file}")
+    return icon_file
+
+
+def _get_icon_file(item_name: str) -> Path:
+    return get_icon_path(wiki_type, item_name) / f"{Path(item_name).name}.png"
+
+
+def _build_sheet_prompt(items: list[Node], rows: int, cols: int, user_prompt: Optional[str]) -> str:
+    style = items[0].style or config.style
+    sections: list[str] = []
+
+    if len(items) == 1:
+        sections.append(f"Create a single inventory icon of {items[0].name}: {items[0].description}")
+    else:
+        sections.append(
+            f"Create a sprite sheet of inventory icons laid out as a strict grid of {rows} rows and {cols} columns "
+            "of equally sized square cells. Fill the cells left to right, top to bottom, one item per cell:\n"
+            + "\n".join(f"{i + 1}. {item.name}: {item.description}" for i, item in enumerate(items))
+        )
+        if len(items) < rows * cols:
+            sections.append("Leave every remaining cell completely empty.")
+
+    guidelines: list[str] = [
+        f"Style: {style}.",
+        "Fully transparent background, no grid lines, borders, labels or text.",
+        "Each item is isolated, centred in its own cell and never touches or crosses the cell edges.",
+        "Leave a clear margin of empty space around every item.",
+        "Show each item from a three-quarter view with soft, even lighting and no cast shadows.",
+    ]
+    sections.append("Guidelines:\n" + "\n".join(f"- {g}" for g in guidelines))
+
+    if user_prompt:
+        sections.append(f"Important additional user instructions: {user_prompt}")
+
+    return "\n\n".join(sections)
+
+
+if __name__ == "__main__":
+    create_item_icons(["caladyn/sunstone_amulet", "caladyn/glass_dagger"])
@@ -1,6 +1,7 @@
 import asyncio
 from typing import Any
 from smith.assetsmith.mesh import build_mesh
+from smith.assetsmith.sound import create_sound
 from smith.models.asset import Asset, AssetType
 from smith.models.node import Node
 from smith.models.wiki import WikiType
@@ -14,10 +15,14 @@ def create_location_assets(node_name: str):
     asyncio.run(create_assets(node_name))
 
 
-async def _create_asset(node_name: str, asset: Asset) -> Any:
+def create_location_asset(node_name: str, asset: Asset, overwrite: bool = False) -> Any:
+    return asyncio.run(_create_asset(node_name, asset, overwrite))
+
+
+async def _create_asset(node_name: str, asset: Asset, overwrite: bool = False) -> Any:
     """Dispatch asset creation based on *type*.
 
-    Audio assets are currently ignored.
+    *overwrite* regenerates audio that already exists.
     """
     match asset.type:
         case AssetType.Texture:
@@ -26,8 +31,7 @@ async def _create_asset(node_name: str, asset: Asset) -> Any:
         case AssetType.Object:
             return await asyncio.to_thread(build_mesh, node_name, wiki_type)
         case AssetType.Audio:
-            # Skip audio for now – return None so the caller knows it was ignored.
-            return None
+            return await asyncio.to_thread(create_sound, node_name, asset, overwrite=overwrite)
         case _:
             raise ValueError(f"Unsupported AssetType: {asset.type}")
 
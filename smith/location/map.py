@@ -10,7 +10,12 @@ wiki_type = WikiType.LOCATION
 
 
 def create_location_map(node_name: str, custom_prompt: str = ""):
-    node_map = get_node_map(wiki_type, node_name)
+    response = OpenAI.complete(*build_map_request(node_name, custom_prompt))
+    return save_location_map(node_name, response)
+
+
+def build_map_request(node_name: str, custom_prompt: str = "") -> tuple[str, str, list[str]]:
+    """Return the ``(system_prompt, user_prompt, image_urls)`` used to generate a node map."""
     arts_names = get_node_arts(wiki_type, node_name)
     arts_urls = [get_art_url(wiki_type, node_name, art_name) for art_name in arts_names]
     user_prompt = _build_map_prompt(node_name, custom_prompt)
@@ -18,8 +23,11 @@ def create_location_map(node_name: str, custom_prompt: str = ""):
         f"You are a game development assistant specializing in Unreal Engine {config.unreal_engine_version} "
         "asset management and prompt engineering."
     )
-    response = OpenAI.complete(system_prompt, user_prompt, arts_urls)
+    return system_prompt, user_prompt, arts_urls
 
+
+def save_location_map(node_name: str, response: dict):
+    node_map = get_node_map(wiki_type, node_name)
     assets = [Asset(**asset) for asset in response["assets"]]
 
     node_map.assets = assets
@@ -0,0 +1,26 @@
+import os
+import tempfile
+from pathlib import Path
+
+import requests
+
+
+def stream_to_file(url: str, dest_path: Path) -> None:
+    """Download *url* to *dest_path* in chunks, replacing it only once the download completes.
+
+    Each call writes to its own temporary file, so concurrent downloads of the
+    same destination never interleave.
+    """
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=dest_path.parent, suffix=".part", delete=False) as fp:
+        partial_path = Path(fp.name)
+        try:
+            with requests.get(url, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    fp.write(chunk)
+        except BaseException:
+            fp.close()
+            partial_path.unlink(missing_ok=True)
+            raise
+    os.replace(partial_path, dest_path)
@@ -30,6 +30,18 @@ def get_texture_path(wiki_type: WikiType, node_name: str) -> Path:
     return get_assets_path(wiki_type, node_name) / "textures"
 
 
+def get_icon_path(wiki_type: WikiType, node_name: str) -> Path:
+    return get_assets_path(wiki_type, node_name) / "icons"
+
+
+def get_audio_path(wiki_type: WikiType, node_name: str) -> Path:
+    return get_assets_path(wiki_type, node_name) / "audio"
+
+
+def get_voice_path(wiki_type: WikiType, node_name: str) -> Path:
+    return get_assets_path(wiki_type, node_name) / "voice"
+
+
 def get_node_arts(wiki_type: WikiType, node_name: str) -> list[str]:
     node_path = get_node_path(wiki_type, node_name)
     arts_path = node_path / "assets" / "arts"
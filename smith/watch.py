@@ -0,0 +1,205 @@
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from config import config
+from smith.assetsmith.mesh import build_mesh
+from smith.assetsmith.voice import create_voices
+from smith.itemsmith import create_item_icons
+from smith.location.assets import create_location_asset
+from smith.models.asset import AssetType
+from smith.models.wiki import WikiType, wiki_type_to_path
+from smith.utils.paths import get_node_map
+
+
+path_to_wiki_type = {path: wiki_type for wiki_type, path in wiki_type_to_path.items()}
+
+
+@dataclass(frozen=True)
+class RebuildJob:
+    kind: str  # "mesh", "asset", "voice" or "icon"
+    wiki_type: WikiType
+    node_name: str
+    asset_name: Optional[str] = None
+
+
+def watch(poll_interval: float = 1.0, debounce: float = 2.0, max_workers: int = 4) -> None:
+    """Watch the wiki and rebuild only what changed, until interrupted.
+
+    Only hand-authored inputs are watched: ``assets/arts/*.png`` and every
+    ``map.json``. Bursts of changes are collected until the tree has been quiet
+    for *debounce* seconds, then turned into the smallest set of rebuilds:
+
+    - an added, changed or removed art rebuilds that node's mesh references and mesh;
+    - an added or edited texture or audio asset rebuilds that asset only
+      (object meshes are built from the arts, so object prompt edits rebuild nothing);
+    - edited character replicas re-voice that character (only new lines are synthesized);
+    - an edited item map regenerates that item's icon.
+    """
+    wiki_root = Path(config.wiki_path)
+    snapshot = _snapshot(wiki_root)
+    maps = {path: _read_map(path) for path in snapshot if path.name == "map.json"}
+
+    changed: set[Path] = set()
+    last_change = 0.0
+    queued: set[RebuildJob] = set()
+    running: dict[RebuildJob, Future] = {}
+
+    print(f"Watching {wiki_root} for changes...")
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            time.sleep(poll_interval)
+
+            current = _snapshot(wiki_root)
+            diff = {path for path in current.keys() | snapshot.keys() if current.get(path) != snapshot.get(path)}
+            snapshot = current
+            if diff:
+                changed |= diff
+                last_change = time.monotonic()
+            elif changed and time.monotonic() - last_change >= debounce:
+                queued |= _collect_jobs(wiki_root, changed, maps)
+                changed = set()
+
+            running = {job: future for job, future in running.items() if not future.done()}
+            # A job already in flight is re-run once it finishes, so the
+            # rebuild always sees the latest inputs.
+            for job in list(queued):
+                if job in running:
+                    continue
+                queued.discard(job)
+                running[job] = executor.submit(_run_job, job)
+    except KeyboardInterrupt:
+        print("Stopping watch; waiting for running rebuilds to finish.")
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _snapshot(wiki_root: Path) -> dict[Path, int]:
+    paths = list(wiki_root.rglob("map.json")) + list(wiki_root.rglob("assets/arts/*.png"))
+    snapshot: dict[Path, int] = {}
+    for path in paths:
+        try:
+            snapshot[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return snapshot
+
+
+def _collect_jobs(wiki_root: Path, changed: set[Path], maps: dict[Path, Optional[dict]]) -> set[RebuildJob]:
+    jobs: set[RebuildJob] = set()
+    for path in changed:
+        try:
+            jobs |= _path_jobs(wiki_root, path, maps)
+        except Exception as exc:
+            # A typo in a hand-edited file must not stop the watcher.
+            print(f"❌ Skipping {path.relative_to(wiki_root)}: {exc!r}")
+    return jobs
+
+
+def _path_jobs(wiki_root: Path, path: Path, maps: dict[Path, Optional[dict]]) -> set[RebuildJob]:
+    parts = path.relative_to(wiki_root).parts
+    wiki_type = path_to_wiki_type.get(parts[0])
+    if wiki_type is None:
+        return set()
+
+    if path.name == "map.json":
+        node_name = "/".join(parts[1:-1])
+        previous = maps.get(path)
+        current = _read_map(path)
+        if not isinstance(current, dict):
+            # Deleted, half-written or not an object; keep the last good map to diff against.
+            return set()
+        if not isinstance(previous, dict):
+            previous = {}
+        jobs = _map_jobs(wiki_type, node_name, previous, current)
+        maps[path] = current
+        return jobs
+
+    if wiki_type in (WikiType.CHARACTER, WikiType.LOCATION):
+        # <type>/<node>/assets/arts/<art>.png
+        node_name = "/".join(parts[1:-3])
+        print(f"Art {path.name} changed in {node_name}")
+        return {RebuildJob("mesh", wiki_type, node_name)}
+
+    return set()
+
+
+def _map_jobs(wiki_type: WikiType, node_name: str, previous: dict, current: dict) -> set[RebuildJob]:
+    match wiki_type:
+        case WikiType.LOCATION:
+            # The previous map may itself be a bad hand edit loaded at startup.
+            previous_list = previous.get("assets")
+            previous_assets = {
+                asset.get("name"): asset
+                for asset in (previous_list if isinstance(previous_list, list) else [])
+                if isinstance(asset, dict)
+            }
+            jobs: set[RebuildJob] = set()
+            for asset in current.get("assets", []):
+                if previous_assets.get(asset["name"]) == asset:
+                    continue
+                if AssetType(asset["type"]) == AssetType.Object:
+                    # build_mesh works from assets/arts only, so an edited object
+                    # prompt has nothing to rebuild; art changes trigger the mesh.
+                    print(f"Asset {asset['name']} changed in {node_name}; object meshes are built from the arts, skipping")
+                    continue
+                print(f"Asset {asset['name']} changed in {node_name}")
+                jobs.add(RebuildJob("asset", wiki_type, node_name, asset["name"]))
+            return jobs
+        case WikiType.CHARACTER:
+            keys = ("replicas", "voice_id")
+            if all(previous.get(key) == current.get(key) for key in keys):
+                return set()
+            print(f"Replicas changed for {node_name}")
+            return {RebuildJob("voice", wiki_type, node_name)}
+        case WikiType.ITEM:
+            if previous == current:
+                return set()
+            print(f"Item {node_name} changed")
+            return {RebuildJob("icon", wiki_type, node_name)}
+        case _:
+            return set()
+
+
+def _run_job(job: RebuildJob) -> None:
+    print(f"Rebuilding {job.kind} for {job.node_name}" + (f" ({job.asset_name})" if job.asset_name else ""))
+    try:
+        match job.kind:
+            case "mesh":
+                build_mesh(job.node_name, job.wiki_type)
+            case "asset":
+                _rebuild_asset(job.node_name, job.asset_name)
+            case "voice":
+                create_voices(job.node_name)
+            case "icon":
+                create_item_icons([job.node_name], overwrite=True)
+            case _:
+                raise ValueError(f"Unsupported rebuild: {job.kind}")
+        print(f"✅ Rebuilt {job.kind} for {job.node_name}")
+    except Exception as exc:
+        print(f"❌ Error rebuilding {job.kind} for {job.node_name}: {exc}")
+
+
+def _rebuild_asset(node_name: str, asset_name: str) -> None:
+    node = get_node_map(WikiType.LOCATION, node_name)
+    asset = next((asset for asset in node.assets if asset.name == asset_name), None)
+    if asset is None:
+        print(f"Asset {asset_name} no longer exists in {node_name}")
+        return
+
+    create_location_asset(node_name, asset, overwrite=True)
+
+
+def _read_map(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+if __name__ == "__main__":
+    watch()